@@ -9,7 +9,7 @@ BAI lockbox file into its constituent records.
 
 '''
 
-import six
+import io
 import sys
 
 from .exceptions import (
@@ -98,12 +98,12 @@ class LockboxBatch(object):
                 'batch summary record expected'
             )
 
-        checks_sum = sum(d.check_amount for d in self.details)
-        if round(checks_sum,2) != round(self.summary.check_dollar_total, 2):
+        checks_sum_cents = sum(d.check_amount_cents for d in self.details)
+        if checks_sum_cents != self.summary.check_dollar_total_cents:
             raise LockboxConsistencyError(
                 'batch expected dollar total ({}) does not match actual total'
                 ' ({})'.format(
-                    checks_sum,
+                    checks_sum_cents / 100.0,
                     self.summary.check_dollar_total,
                 )
             )
@@ -172,8 +172,8 @@ class Lockbox(object):
             for batch
             in self.batches
         )
-        dollar_total = sum(
-            batch.summary.check_dollar_total
+        dollar_total_cents = sum(
+            batch.summary.check_dollar_total_cents
             for batch
             in self.batches
         )
@@ -184,7 +184,7 @@ class Lockbox(object):
         #         ' number'.format(self.total_record.lockbox_number)
         #     )
 
-        # if round(self.total_record.check_dollar_total,2) != round(dollar_total, 2):
+        # if self.total_record.check_dollar_total_cents != dollar_total_cents:
         #     raise LockboxConsistencyError(
         #         'expected dollar total for lockbox {} does not match actual'
         #         ' total'.format(self.total_record.lockbox_number)
@@ -306,6 +306,9 @@ class LockboxFile(object):
                     )
                 # print(f"line_number = {rec_type} rec_type = {line_num}")
                 rec = record_type_to_constructor[rec_type](line)
+                # records only convert their derived fields when asked,
+                # so check them now while we still know the line number
+                rec.validate()
                 lockbox_file.add_record(rec)
             except Exception as e:
                 if not isinstance(e, LockboxError):
@@ -313,10 +316,9 @@ class LockboxFile(object):
 
                 # if this is some lockbox-related exception,  wrap it in an exception that points
                 # to the problematic line.
-                six.raise_from(
-                    LockboxParseError('Error parsing Line {}: {} ("{}")'.format(line_num, str(e), line)),
-                    e
-                )
+                raise LockboxParseError(
+                    'Error parsing Line {}: {} ("{}")'.format(line_num, str(e), line)
+                ) from e
 
         lockbox_file.validate()
         return lockbox_file
@@ -327,7 +329,26 @@ class LockboxFile(object):
         Create a new :class:`~lockbox.parser.LockboxFile` object from the
         contents of a file.
 
-        :param inf: A :class:`File`-like object.
+        :param inf: A :class:`File`-like object, opened in either text or
+                    binary mode.
 
         '''
-        return LockboxFile.from_lines(inf.readlines())
+        contents = inf.read()
+
+        if isinstance(contents, bytes):
+            # lockbox files are plain ASCII, so the whole file can be
+            # decoded in one go rather than having a text-mode file
+            # decode it line by line.
+            try:
+                contents = contents.decode('ascii')
+            except UnicodeDecodeError as e:
+                raise LockboxParseError(
+                    'lockbox file contains non-ASCII characters'
+                ) from e
+
+        # str.splitlines() would also break lines on form feeds and other
+        # separators that can turn up in filler, so split the file the way
+        # reading it line by line in text mode does.
+        lines = io.StringIO(contents, newline=None).readlines()
+
+        return LockboxFile.from_lines(lines)
@@ -10,17 +10,24 @@ lockbox records.
 '''
 
 import datetime
+import functools
+import operator
 import re
-import six
+import string
+import sys
 
 from .exceptions import LockboxDefinitionError, LockboxParseError
 
 
 class LockboxFieldType(object):
-    '''The three possible field types available are ``Numeric``, which is
-    means the field contains only numeric characters, ``Alphanumeric``
-    which actually means all alphanumeric characters as well as
-    ``;:,./()-``.
+    '''The five possible field types are ``Numeric``, ``Alphanumeric``,
+    ``Blank``, ``AlphanumericOrBlank`` and ``Raw``. ``Numeric`` means
+    the field contains only ASCII digits, and ``Alphanumeric`` actually
+    means uppercase letters and digits as well as ``;:,'./()-``.
+    ``Blank`` fields contain only spaces, while ``AlphanumericOrBlank``
+    fields may be blank or contain the alphanumeric characters plus
+    ``%#_&``. ``Raw`` fields aren't checked at all, and are meant for
+    filler at the end of a record.
 
     .. note:: This class isn't meant to be instantiated, but rather like
               an enum.
@@ -29,10 +36,334 @@ class LockboxFieldType(object):
     Alphanumeric = 'alphanumeric'
     Blank = 'blank'
     AlphanumericOrBlank = 'alphanumericorblank'
+    Raw = 'raw'
 
 
-class LockboxBaseRecord(object):
-    # Valid types are listed inside the LockboxFieldType class.
+_ALPHANUMERIC_CHARS = frozenset(
+    string.ascii_uppercase + string.digits + " ;:,'./()-"
+)
+_ALPHANUMERIC_OR_BLANK_CHARS = frozenset(
+    string.ascii_uppercase + string.digits + " ;%#:',./_&()-"
+)
+
+
+# Each validator takes the stripped value of a field. These are plain
+# character set checks rather than regexps, since matching a fixed
+# character class doesn't need anything the regexp engine offers.
+def _is_numeric(value):
+    # isdigit() alone would also accept non-ASCII digits
+    return value.isdigit() and value.isascii()
+
+
+def _is_alphanumeric(value):
+    return bool(value) and _ALPHANUMERIC_CHARS.issuperset(value)
+
+
+def _is_blank(value):
+    return not value
+
+
+def _is_alphanumeric_or_blank(value):
+    return _ALPHANUMERIC_OR_BLANK_CHARS.issuperset(value)
+
+
+def _is_raw(value):
+    return True
+
+
+_VALIDATORS = {
+    LockboxFieldType.Numeric: _is_numeric,
+    LockboxFieldType.Alphanumeric: _is_alphanumeric,
+    LockboxFieldType.Blank: _is_blank,
+    LockboxFieldType.AlphanumericOrBlank: _is_alphanumeric_or_blank,
+    LockboxFieldType.Raw: _is_raw,
+}
+
+
+def _char_class(chars):
+    return '[{}]'.format(re.escape(''.join(sorted(chars))))
+
+
+# Patterns for a whole field of the given width, padded out with spaces.
+# These are stricter than the validators above (a field padded with
+# tabs or a numeric field padded with spaces won't match), which is fine
+# since anything they reject just gets checked field by field instead.
+_FIELD_PATTERNS = {
+    LockboxFieldType.Numeric: lambda width: '[0-9]{{{}}}'.format(width),
+    LockboxFieldType.Alphanumeric: lambda width: '(?! {{{}}}){}{{{}}}'.format(
+        width,
+        _char_class(_ALPHANUMERIC_CHARS),
+        width,
+    ),
+    LockboxFieldType.Blank: lambda width: ' {{{}}}'.format(width),
+    LockboxFieldType.AlphanumericOrBlank: lambda width: '{}{{{}}}'.format(
+        _char_class(_ALPHANUMERIC_OR_BLANK_CHARS),
+        width,
+    ),
+    LockboxFieldType.Raw: lambda width: '.{{{}}}'.format(width),
+}
+
+
+# A file only ever has a handful of distinct dates and times spread
+# over all of its records, so the conversions are cached rather than
+# redone for each record.
+@functools.lru_cache(maxsize=512)
+def _yymmdd_to_date(value):
+    return datetime.date(
+        int(value[0:2]) + 2000,
+        int(value[2:4]),
+        int(value[4:6]),
+    )
+
+
+@functools.lru_cache(maxsize=512)
+def _mmddyy_to_date(value):
+    return datetime.date(
+        int(value[4:6]) + 2000,
+        int(value[0:2]),
+        int(value[2:4]),
+    )
+
+
+@functools.lru_cache(maxsize=512)
+def _hhmm_to_time(value):
+    return datetime.time(
+        int(value[0:2]),
+        int(value[2:4]),
+    )
+
+
+def _invalid_field_error(field_name, field_type, raw_field):
+    return LockboxParseError(
+        'field {} does not match expected type {}, value = "{}"'.format(
+            field_name,
+            field_type,
+            raw_field
+        )
+    )
+
+
+def _build_line_pattern(parse_plan):
+    '''Build a single regexp which matches a whole record only if every
+    one of its fields is valid. Returns a ``(pattern, width)`` tuple,
+    where the record has to be padded with spaces to ``width`` (the end
+    of its last checked field) before matching, or ``None`` if the fields
+    overlap and so can't be checked with one pattern.
+    '''
+    pattern = []
+    col = 0
+
+    plan_by_col = sorted(parse_plan, key=lambda plan_entry: plan_entry[2])
+
+    # there's nothing to check in raw fields at the end of a record, so
+    # leave them out rather than padding the line out to cover them.
+    while plan_by_col and plan_by_col[-1][4] == LockboxFieldType.Raw:
+        plan_by_col.pop()
+
+    for _, _, start_col, end_col, field_type, _ in plan_by_col:
+        if start_col < col:
+            return None
+
+        if start_col > col:
+            pattern.append('.{{{}}}'.format(start_col - col))
+
+        pattern.append(_FIELD_PATTERNS[field_type](end_col - start_col))
+        col = end_col
+
+    return re.compile(''.join(pattern), re.DOTALL), col
+
+
+def _build_parse_method(cls):
+    '''Generate the ``_parse`` method for a record class, specialized to
+    its fields so that the method doesn't have to loop over the parse
+    plan at all. For a record with a single numeric field ``foo`` at
+    columns 1-3 it'd look like::
+
+        def _parse(self):
+            text = self.raw_record_text
+            v0, = _slice_fields(text)
+            if _match_line(text.ljust(3)) is None:
+                if not _is_valid_0(v0.strip()):
+                    raise _invalid_field_error('foo', 'numeric', v0)
+            self._foo_raw = v0
+
+    Every field is checked by matching the record's line pattern, and
+    only if that fails are the fields checked one by one to find out
+    which is invalid.
+    '''
+    namespace = {
+        '_slice_fields': cls._slice_fields,
+        '_invalid_field_error': _invalid_field_error,
+    }
+    source = [
+        'def _parse(self):',
+        '    text = self.raw_record_text',
+        '    {}, = _slice_fields(text)'.format(
+            ', '.join('v{}'.format(i) for i in range(len(cls._parse_plan)))
+        ),
+    ]
+
+    indent = '    '
+    if cls._line_pattern is not None:
+        line_pattern, line_width = cls._line_pattern
+        namespace['_match_line'] = line_pattern.match
+        source.append(
+            '    if _match_line(text.ljust({})) is None:'.format(line_width)
+        )
+        indent = '        '
+
+    for i, plan_entry in enumerate(cls._parse_plan):
+        field_name, _, _, _, field_type, is_valid = plan_entry
+        if field_type == LockboxFieldType.Raw:
+            continue
+
+        namespace['_is_valid_{}'.format(i)] = is_valid
+        source.extend([
+            '{}if not _is_valid_{}(v{}.strip()):'.format(indent, i, i),
+            '{}    raise _invalid_field_error({!r}, {!r}, v{})'.format(
+                indent,
+                field_name,
+                field_type,
+                i,
+            ),
+        ])
+
+    namespace['_intern'] = sys.intern
+    for i, plan_entry in enumerate(cls._parse_plan):
+        if plan_entry[0] in cls.REPEATED_FIELDS:
+            source.append('    self.{} = _intern(v{})'.format(plan_entry[1], i))
+        else:
+            source.append('    self.{} = v{}'.format(plan_entry[1], i))
+
+    code = compile(
+        '\n'.join(source),
+        '<{}._parse>'.format(cls.__name__),
+        'exec',
+    )
+    exec(code, namespace)
+    return namespace['_parse']
+
+
+# every record starts with its record type, so this is added to the
+# fields of each record class automatically
+_RECORD_TYPE_FIELD = ('record_type', (0, 1), LockboxFieldType.Numeric)
+
+
+# Stands in for a derived field's value until it's been worked out, so
+# that a cache miss doesn't have to go through raising AttributeError.
+_NOT_CACHED = object()
+
+
+class derived_field(object):
+    '''Decorator which turns a method of a record into a field whose value
+    is worked out from the raw field values the first time it's read,
+    rather than for every record as it's parsed. The value is then kept
+    in the record's ``_<name>_cached`` slot.
+    '''
+    def __init__(self, func):
+        self.func = func
+        self.name = func.__name__
+        self.cache_name = '_{}_cached'.format(self.name)
+        self.__doc__ = func.__doc__
+
+    def __get__(self, record, owner=None):
+        if record is None:
+            return self
+
+        value = getattr(record, self.cache_name, _NOT_CACHED)
+        if value is _NOT_CACHED:
+            value = self.func(record)
+            setattr(record, self.cache_name, value)
+
+        return value
+
+    def __set__(self, record, value):
+        setattr(record, self.cache_name, value)
+
+
+class LockboxRecordMeta(type):
+    '''Metaclass for lockbox records. It works out a record class's full
+    field list (``_field_defs``, which always ends with ``record_type``)
+    and its derived fields (``_derived_field_names``, including inherited
+    ones) once, and gives every class that defines ``fields`` a
+    ``__slots__`` holding the fields and their raw values, so records
+    don't each carry a ``__dict__``.
+
+    Subclasses which don't define ``fields`` are left alone, and so get a
+    ``__dict__`` as usual. A class that defines ``fields`` and still wants
+    one can list ``'__dict__'`` in its own ``__slots__``, which are kept.
+    '''
+    def __new__(mcs, name, bases, namespace, **kwargs):
+        own_derived_field_names = [
+            attr_name
+            for attr_name, attr in namespace.items()
+            if isinstance(attr, derived_field)
+        ]
+        derived_field_names = list(own_derived_field_names)
+        for base in bases:
+            for field_name in getattr(base, '_derived_field_names', ()):
+                if field_name not in derived_field_names:
+                    derived_field_names.append(field_name)
+        namespace['_derived_field_names'] = tuple(derived_field_names)
+
+        fields = namespace.get('fields')
+        if fields is None:
+            return super(LockboxRecordMeta, mcs).__new__(
+                mcs, name, bases, namespace, **kwargs
+            )
+
+        fields = list(fields)
+        field_names = [field_name for field_name, _, _ in fields]
+        if 'record_type' not in field_names:
+            fields.append(_RECORD_TYPE_FIELD)
+            field_names.append('record_type')
+        namespace['_field_defs'] = tuple(fields)
+
+        # this has to happen before the class is created, since the
+        # slots themselves would otherwise clash with every field.
+        for i, field_name in enumerate(field_names):
+            if field_name in field_names[:i]:
+                raise LockboxDefinitionError(
+                    'duplicate field "{}"'.format(field_name)
+                )
+
+            if field_name in derived_field_names:
+                continue
+
+            if field_name in namespace or any(
+                hasattr(base, field_name) for base in bases
+            ):
+                raise LockboxDefinitionError(
+                    'LockboxRecord already has field "{}"'.format(field_name)
+                )
+
+        slots = namespace.get('__slots__', ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        namespace['__slots__'] = (
+            tuple(slots)
+            + tuple(
+                field_name
+                for field_name in field_names
+                if field_name not in derived_field_names
+            )
+            + tuple('_{}_raw'.format(field_name) for field_name in field_names)
+            + tuple(
+                '_{}_cached'.format(field_name)
+                for field_name in own_derived_field_names
+            )
+        )
+
+        return super(LockboxRecordMeta, mcs).__new__(
+            mcs, name, bases, namespace, **kwargs
+        )
+
+
+class LockboxBaseRecord(object, metaclass=LockboxRecordMeta):
+    # Fields are defined by setting 'fields' to a list of
+    # (name, (start_col, end_col), type) tuples, in the order they
+    # appear in the record. Valid types are listed inside the
+    # LockboxFieldType class.
 
     # Note: The record type which is determined by first character of
     # a line is defined by setting MAX_RECORD_LENGTH in a derrived
@@ -44,8 +375,82 @@ class LockboxBaseRecord(object):
 
     RECORD_TYPE_NUM = None
 
-    raw_record_text = ''
-    children = []
+    # Fields whose values are the same across most records in a file
+    # (the lockbox number, say). Their raw values are interned so all
+    # those records share a single string.
+    REPEATED_FIELDS = frozenset()
+
+    _derived_fields = ()
+
+    __slots__ = ('raw_record_text',)
+
+    def __init_subclass__(cls, **kwargs):
+        super(LockboxBaseRecord, cls).__init_subclass__(**kwargs)
+
+        derived_fields = [
+            getattr(cls, field_name, None)
+            for field_name in cls._derived_field_names
+        ]
+        cls._derived_fields = tuple(
+            derived for derived in derived_fields
+            if isinstance(derived, derived_field)
+        )
+
+        if not hasattr(cls, '_field_defs'):
+            return
+
+        # the field definitions never change once the class exists, so
+        # work out everything _parse() needs for each field up front
+        # rather than once per record.
+        parse_plan = []
+        for field_name, (start_col, end_col), field_type in cls._field_defs:
+            is_valid = _VALIDATORS.get(field_type)
+            if is_valid is None:
+                raise LockboxDefinitionError(
+                    'invalid field type found: "{}"'.format(field_type)
+                )
+
+            parse_plan.append((
+                field_name,
+                '_{}_raw'.format(field_name),
+                start_col,
+                end_col,
+                field_type,
+                is_valid,
+            ))
+
+        cls._parse_plan = tuple(parse_plan)
+
+        for field_name in cls.REPEATED_FIELDS:
+            if field_name not in [plan_entry[0] for plan_entry in parse_plan]:
+                raise LockboxDefinitionError(
+                    'unknown repeated field "{}"'.format(field_name)
+                )
+
+        # fields without a derived_field are just their raw value (or
+        # None, for blank fields)
+        cls._plain_fields = tuple(
+            (field_name, raw_field_name, field_type)
+            for field_name, raw_field_name, _, _, field_type, _ in parse_plan
+            if field_name not in cls._derived_field_names
+        )
+
+        # a single itemgetter call slices every field out of a line in
+        # one go and hands them back as a tuple in _parse_plan order.
+        field_slices = [
+            slice(start_col, end_col)
+            for _, _, start_col, end_col, _, _ in parse_plan
+        ]
+        if len(field_slices) == 1:
+            field_slice = field_slices[0]
+            cls._slice_fields = staticmethod(lambda text: (text[field_slice],))
+        else:
+            cls._slice_fields = operator.itemgetter(*field_slices)
+
+        cls._line_pattern = _build_line_pattern(parse_plan)
+
+        if '_parse' not in vars(cls):
+            cls._parse = _build_parse_method(cls)
 
     def __init__(self, raw_record_text):
         if len(raw_record_text) > self.MAX_RECORD_LENGTH:
@@ -57,98 +462,49 @@ class LockboxBaseRecord(object):
 
         if hasattr(self, 'fields'):
             # we can only parse if there are actually fields defined
-            self.fields['record_type'] = {
-                'location': (0,1),
-                'type':  LockboxFieldType.Numeric,
-            }
             self._parse()
 
-            if hasattr(self, 'validate'):
-                self.validate()
-
             # all of the basic type checking (alphanumeric vs numeric)
-            # has already been performed by the regexps in _parse(),
-            # so at this point we just create any missing fields by
-            # doing self.my_field = self._my_field_raw
-            for field_name, field_def in six.iteritems(self.fields):
-                if hasattr(self, field_name):
-                    continue
-
-                raw_field_name = '_{}_raw'.format(field_name)
-
+            # has already been performed in _parse(), so at this point
+            # we just create the fields which aren't derived from their raw
+            # value by doing self.my_field = self._my_field_raw
+            for field_name, raw_field_name, field_type in self._plain_fields:
                 raw_field_val = (
                     None
-                    if field_def['type'] ==  LockboxFieldType.Blank
-                    else getattr(self, raw_field_name, None)
+                    if field_type ==  LockboxFieldType.Blank
+                    else getattr(self, raw_field_name)
                 )
 
                 setattr(self, field_name, raw_field_val)
 
-    def _parse(self):
-        for field_name, field_def in six.iteritems(self.fields):
-            raw_field_name = '_{}_raw'.format(field_name)
-            if hasattr(self, field_name):
-                raise AttributeError(
-                    'LockboxRecord already has field "{}"'.format(
-                        field_name,
-                    )
-                )
-
-            start_col, end_col = field_def['location']
-            raw_field = self.raw_record_text[start_col:end_col]
-
-            if field_def['type'] ==  LockboxFieldType.Alphanumeric:
-                patt = re.compile(r'''^[ A-Z0-9;:,'./()-]+$''')
-            elif field_def['type'] ==  LockboxFieldType.Numeric:
-                patt = re.compile(r'^[0-9]+$')
-            elif field_def['type'] ==  LockboxFieldType.Blank:
-                patt = re.compile(r'^\s*$')
-            elif field_def['type'] ==  LockboxFieldType.AlphanumericOrBlank:
-                patt = re.compile(r'''^$|^[ A-Z0-9;%#:',./_&()-]+$''')
-            else:
-                raise LockboxDefinitionError(
-                    'invalid field type found: "{}"'.format(field_def['type'])
-                )
-
-            if not patt.match(raw_field.strip()):
-                raise LockboxParseError(
-                    'field {} does not match expected type {}, value = "{}"'.format(
-                        field_name,
-                        field_def['type'],
-                        raw_field
-                    )
-                )
-
-            setattr(self, raw_field_name, raw_field)
+    def validate(self):
+        '''Work out every derived field of the record straight away,
+        rather than when each is first read, so that any problem with
+        their raw values is raised now.
+        '''
+        # fill each field's cache slot directly instead of going through
+        # derived_field.__get__, which would first have to look the
+        # (still empty) slot up.
+        for derived in self._derived_fields:
+            setattr(self, derived.cache_name, derived.func(self))
 
     def _parse_as_date(self, field_name, mmddyy=False):
-        raw_field_name = '_{}_raw'.format(field_name)
-
-        if not hasattr(self, raw_field_name):
+        try:
+            field_val = getattr(self, '_{}_raw'.format(field_name))
+        except AttributeError:
             raise AttributeError("'{}' has no field '{}'".format(
                 self.__class__.__name__,
                 field_name
             ))
 
         try:
-            field_val = getattr(self, raw_field_name)
             if len(field_val) != 6:
                 raise ValueError()
 
             if not mmddyy:
-                parsed_date = datetime.date(
-                    # format of the (raw) field is YYMMDD
-                    int(field_val[0:2]) + 2000,
-                    int(field_val[2:4]),
-                    int(field_val[4:6]),
-                )
+                parsed_date = _yymmdd_to_date(field_val)
             else:
-                parsed_date = datetime.date(
-                    # format of the (raw) field is MMDDYY
-                    int(field_val[4:6]) + 2000,
-                    int(field_val[0:2]),
-                    int(field_val[2:4]),
-                )
+                parsed_date = _mmddyy_to_date(field_val)
         except ValueError:
             raise LockboxDefinitionError(
                 '{} is not a valid YYMMDD-formatted date'.format(
@@ -159,24 +515,19 @@ class LockboxBaseRecord(object):
         return parsed_date
 
     def _parse_as_time(self, field_name):
-        raw_field_name = '_{}_raw'.format(field_name)
-
-        if not hasattr(self, raw_field_name):
+        try:
+            field_val = getattr(self, '_{}_raw'.format(field_name))
+        except AttributeError:
             raise AttributeError("'{}' has no field '{}'".format(
                 self.__class__.__name__,
                 field_name
             ))
 
         try:
-            field_val = getattr(self, raw_field_name)
             if len(field_val) != 4:
                 raise ValueError()
 
-            parsed_time = datetime.time(
-                # format of the (raw) field is HHMM
-                int(field_val[0:2]),
-                int(field_val[2:4]),
-            )
+            parsed_time = _hhmm_to_time(field_val)
         except ValueError:
             raise LockboxDefinitionError(
                 '{} is not a valid HHMM formatted date'.format(
@@ -190,151 +541,232 @@ class LockboxBaseRecord(object):
 class LockboxImmediateAddressHeader(LockboxBaseRecord):
     RECORD_TYPE_NUM = 1
 
-    fields = {
-        'priority_code': { 'location': (1, 3), 'type':  LockboxFieldType.Numeric },
-        'destination_id': { 'location': (3, 13), 'type':  LockboxFieldType.Alphanumeric },
-        'originating_trn': { 'location': (13, 23), 'type':  LockboxFieldType.Numeric },
-        'processing_date': { 'location': (23, 29), 'type':  LockboxFieldType.Numeric },
-        'processing_time': { 'location': (29, 33), 'type':  LockboxFieldType.Numeric },
-        'filler': {'location': (33, 104), 'type':  LockboxFieldType.AlphanumericOrBlank },
-    }
+    fields = [
+        ('priority_code',   (1, 3),    LockboxFieldType.Numeric),
+        ('destination_id',  (3, 13),   LockboxFieldType.Alphanumeric),
+        ('originating_trn', (13, 23),  LockboxFieldType.Numeric),
+        ('processing_date', (23, 29),  LockboxFieldType.Numeric),
+        ('processing_time', (29, 33),  LockboxFieldType.Numeric),
+        ('filler',          (33, 104), LockboxFieldType.Raw),
+    ]
 
-    def validate(self):
-        self.processing_date = self._parse_as_date('processing_date')
-        self.processing_time = self._parse_as_time('processing_time')
+    @derived_field
+    def processing_date(self):
+        return self._parse_as_date('processing_date')
+
+    @derived_field
+    def processing_time(self):
+        return self._parse_as_time('processing_time')
 
 
 class LockboxServiceRecord(LockboxBaseRecord):
     RECORD_TYPE_NUM = 2
 
-    fields = {
-        'destination':         {'location': (1, 11),  'type': LockboxFieldType.AlphanumericOrBlank},
-        'bank_origin':         {'location': (11, 21), 'type': LockboxFieldType.AlphanumericOrBlank},
-        'reference_code':      {'location': (21, 31), 'type': LockboxFieldType.AlphanumericOrBlank},
-        'service_code':        {'location': (31, 34), 'type': LockboxFieldType.AlphanumericOrBlank},
-        'record_length':       {'location': (34, 37), 'type': LockboxFieldType.AlphanumericOrBlank},
-        'characters_per_block':{'location': (37, 41), 'type': LockboxFieldType.AlphanumericOrBlank},
-        'partial_compression': {'location': (41, 42), 'type': LockboxFieldType.AlphanumericOrBlank},
-        'filler':              {'location': (42, 81), 'type': LockboxFieldType.Blank},
-    }
+    fields = [
+        ('destination',          (1, 11),  LockboxFieldType.AlphanumericOrBlank),
+        ('bank_origin',          (11, 21), LockboxFieldType.AlphanumericOrBlank),
+        ('reference_code',       (21, 31), LockboxFieldType.AlphanumericOrBlank),
+        ('service_code',         (31, 34), LockboxFieldType.AlphanumericOrBlank),
+        ('record_length',        (34, 37), LockboxFieldType.AlphanumericOrBlank),
+        ('characters_per_block', (37, 41), LockboxFieldType.AlphanumericOrBlank),
+        ('partial_compression',  (41, 42), LockboxFieldType.AlphanumericOrBlank),
+        ('filler',               (42, 81), LockboxFieldType.Blank),
+    ]
 
 
 class LockboxDetailHeader(LockboxBaseRecord):
     RECORD_TYPE_NUM = 5
 
-    fields = {
-        'batch_number':   {'location': (1, 4),    'type':  LockboxFieldType.AlphanumericOrBlank },
-        'item_number':    {'location': (4, 7, ),  'type':  LockboxFieldType.AlphanumericOrBlank },
-        'lockbox_number': {'location': (7, 14),   'type':  LockboxFieldType.AlphanumericOrBlank },
-        'deposit_date':   {'location': (14, 20),  'type':  LockboxFieldType.AlphanumericOrBlank },
-        'destination':    {'location': (20, 30),  'type':  LockboxFieldType.AlphanumericOrBlank},
-        'destination':    {'location': (30, 40),  'type':  LockboxFieldType.AlphanumericOrBlank},
-        'filler':         {'location': (40, 104), 'type':  LockboxFieldType.AlphanumericOrBlank },
-    }
+    REPEATED_FIELDS = frozenset([
+        'lockbox_number',
+        'deposit_date',
+        'destination_1',
+        'destination_2',
+    ])
 
-    def validate(self):
-        self.batch_number = int(self._batch_number_raw)
-        # self.deposit_date = self._parse_as_date('deposit_date')
+    fields = [
+        ('batch_number',   (1, 4),    LockboxFieldType.AlphanumericOrBlank),
+        ('item_number',    (4, 7),    LockboxFieldType.AlphanumericOrBlank),
+        ('lockbox_number', (7, 14),   LockboxFieldType.AlphanumericOrBlank),
+        ('deposit_date',   (14, 20),  LockboxFieldType.AlphanumericOrBlank),
+        ('destination_1',  (20, 30),  LockboxFieldType.AlphanumericOrBlank),
+        ('destination_2',  (30, 40),  LockboxFieldType.AlphanumericOrBlank),
+        ('filler',         (40, 104), LockboxFieldType.Raw),
+    ]
+
+    @derived_field
+    def batch_number(self):
+        return int(self._batch_number_raw)
+
+    # @derived_field
+    # def deposit_date(self):
+    #     return self._parse_as_date('deposit_date')
 
 
 class LockboxDetailRecord(LockboxBaseRecord):
     RECORD_TYPE_NUM = 6
 
-    fields = {
-        'batch_number':           { 'location': (1, 4),   'type': LockboxFieldType.AlphanumericOrBlank },
-        'item_number':            { 'location': (4, 7),   'type': LockboxFieldType.AlphanumericOrBlank },
-        'check_amount':           { 'location': (7, 17),  'type': LockboxFieldType.AlphanumericOrBlank },
-        'transit_routing_number': { 'location': (17, 26), 'type': LockboxFieldType.AlphanumericOrBlank },
-        'dd_account_number':      { 'location': (26, 40), 'type': LockboxFieldType.AlphanumericOrBlank },
-        'check_number':           { 'location': (40, 50), 'type': LockboxFieldType.AlphanumericOrBlank },
-        'filler':                 { 'location': (50, 77), 'type': LockboxFieldType.AlphanumericOrBlank }
-    }
+    REPEATED_FIELDS = frozenset(['batch_number'])
 
-    def validate(self):
+    fields = [
+        ('batch_number',           (1, 4),   LockboxFieldType.AlphanumericOrBlank),
+        ('item_number',            (4, 7),   LockboxFieldType.AlphanumericOrBlank),
+        ('check_amount',           (7, 17),  LockboxFieldType.AlphanumericOrBlank),
+        ('transit_routing_number', (17, 26), LockboxFieldType.AlphanumericOrBlank),
+        ('dd_account_number',      (26, 40), LockboxFieldType.AlphanumericOrBlank),
+        ('check_number',           (40, 50), LockboxFieldType.AlphanumericOrBlank),
+        ('filler',                 (50, 77), LockboxFieldType.Raw),
+    ]
+
+    @derived_field
+    def batch_number(self):
         if not self._batch_number_raw.isnumeric():
-            self._batch_number_raw = '0'
-        self.batch_number = int(self._batch_number_raw)
+            return 0
+        return int(self._batch_number_raw)
+
+    @derived_field
+    def item_number(self):
         if not self._item_number_raw.isnumeric():
-            self._item_number_raw = '0'
-        # self.item_number = int(self._item_number_raw)
+            return '0'
+        # return int(self._item_number_raw)
+        return self._item_number_raw
+
+    @derived_field
+    def check_amount_cents(self):
         if not self._check_amount_raw.isnumeric():
-            self._check_amount_raw = '0'
-        self.check_amount = int(self._check_amount_raw) / 100.00
-        if len(self._check_number_raw) == 0:
-            self._check_number_raw = '0'
+            return 0
+        return int(self._check_amount_raw)
+
+    @derived_field
+    def check_amount(self):
+        return self.check_amount_cents / 100.00
+
+    @derived_field
+    def check_number(self):
         if not self._check_number_raw.isnumeric():
-            self._check_number_raw = '0'
-        self.check_number = int(self._check_number_raw)
+            return 0
+        return int(self._check_number_raw)
 
 
 class LockboxDetailOverflowRecord(LockboxBaseRecord):
     RECORD_TYPE_NUM = 4
 
-    fields = {
-        'batch_number':             { 'location': (1, 4), 'type':  LockboxFieldType.AlphanumericOrBlank },
-        'item_number':              { 'location': (4, 7), 'type':  LockboxFieldType.AlphanumericOrBlank },
-        'overflow_record_type':     { 'location': (7, 8), 'type':  LockboxFieldType.AlphanumericOrBlank },
-        'overflow_sequence_number': { 'location': (8, 10), 'type':  LockboxFieldType.AlphanumericOrBlank },
-        'overflow_code':            { 'location': (10, 11), 'type':  LockboxFieldType.AlphanumericOrBlank },
-        'memo_line':                { 'location': (11, 80), 'type':  LockboxFieldType.AlphanumericOrBlank }
-    }
+    REPEATED_FIELDS = frozenset(['batch_number'])
 
-    def validate(self):
-        self.batch_number = int(self._batch_number_raw)
-        self.item_number = int(self._item_number_raw)
-        self.overflow_record_type = int(self._overflow_record_type_raw)
-        self.overflow_sequence_number = int(self._overflow_sequence_number_raw)
+    fields = [
+        ('batch_number',             (1, 4),   LockboxFieldType.AlphanumericOrBlank),
+        ('item_number',              (4, 7),   LockboxFieldType.AlphanumericOrBlank),
+        ('overflow_record_type',     (7, 8),   LockboxFieldType.AlphanumericOrBlank),
+        ('overflow_sequence_number', (8, 10),  LockboxFieldType.AlphanumericOrBlank),
+        ('overflow_code',            (10, 11), LockboxFieldType.AlphanumericOrBlank),
+        ('memo_line',                (11, 80), LockboxFieldType.AlphanumericOrBlank),
+    ]
+
+    @derived_field
+    def batch_number(self):
+        return int(self._batch_number_raw)
+
+    @derived_field
+    def item_number(self):
+        return int(self._item_number_raw)
+
+    @derived_field
+    def overflow_record_type(self):
+        return int(self._overflow_record_type_raw)
+
+    @derived_field
+    def overflow_sequence_number(self):
+        return int(self._overflow_sequence_number_raw)
 
 
 class LockboxBatchTotalRecord(LockboxBaseRecord):
     RECORD_TYPE_NUM = 7
 
-    fields = {
-        'batch_number':             { 'location': (1, 4),   'type': LockboxFieldType.AlphanumericOrBlank },
-        'item_number':              { 'location': (4, 7),   'type': LockboxFieldType.AlphanumericOrBlank },
-        'lockbox_number':           { 'location': (7, 14),  'type': LockboxFieldType.AlphanumericOrBlank },
-        'deposit_date':             { 'location': (14, 20), 'type': LockboxFieldType.AlphanumericOrBlank },
-        'total_number_remittances': { 'location': (20, 23), 'type': LockboxFieldType.AlphanumericOrBlank },
-        'check_dollar_total':       { 'location': (23, 33), 'type': LockboxFieldType.Numeric },
-        'filler':                   { 'location': (33, 81), 'type': LockboxFieldType.AlphanumericOrBlank },
-    }
+    REPEATED_FIELDS = frozenset(['lockbox_number', 'deposit_date'])
 
-    def validate(self):
-        self.batch_number = int(self._batch_number_raw)
-        self.item_number = int(self._item_number_raw)
-        self.deposit_date = self._parse_as_date('deposit_date')
-        self.total_number_remittances = int(self._total_number_remittances_raw)
-        self.check_dollar_total = int(self._check_dollar_total_raw) / 100.0
+    fields = [
+        ('batch_number',             (1, 4),   LockboxFieldType.AlphanumericOrBlank),
+        ('item_number',              (4, 7),   LockboxFieldType.AlphanumericOrBlank),
+        ('lockbox_number',           (7, 14),  LockboxFieldType.AlphanumericOrBlank),
+        ('deposit_date',             (14, 20), LockboxFieldType.AlphanumericOrBlank),
+        ('total_number_remittances', (20, 23), LockboxFieldType.AlphanumericOrBlank),
+        ('check_dollar_total',       (23, 33), LockboxFieldType.Numeric),
+        ('filler',                   (33, 81), LockboxFieldType.Raw),
+    ]
+
+    @derived_field
+    def batch_number(self):
+        return int(self._batch_number_raw)
+
+    @derived_field
+    def item_number(self):
+        return int(self._item_number_raw)
+
+    @derived_field
+    def deposit_date(self):
+        return self._parse_as_date('deposit_date')
+
+    @derived_field
+    def total_number_remittances(self):
+        return int(self._total_number_remittances_raw)
+
+    @derived_field
+    def check_dollar_total_cents(self):
+        return int(self._check_dollar_total_raw)
+
+    @derived_field
+    def check_dollar_total(self):
+        return self.check_dollar_total_cents / 100.0
 
 
 class LockboxServiceTotalRecord(LockboxBaseRecord):
     RECORD_TYPE_NUM = 8
 
-    fields = {
-        'batch_number':          { 'location': (1, 4),    'type': LockboxFieldType.Numeric },
-        'item_number':           { 'location': (4, 7),    'type': LockboxFieldType.Numeric },
-        'lockbox_number':        { 'location': (7, 14),   'type': LockboxFieldType.AlphanumericOrBlank },
-        'deposit_date':          { 'location': (14, 20),  'type': LockboxFieldType.Numeric },
-        'total_num_checks':      { 'location': (20, 24),  'type': LockboxFieldType.Numeric },
-        'check_dollar_total':    { 'location': (24, 34),  'type': LockboxFieldType.Numeric },
-        'last_record_indicator': { 'location': (34, 35),  'type': LockboxFieldType.AlphanumericOrBlank },
-        'filler':                { 'location': (35, 104), 'type': LockboxFieldType.AlphanumericOrBlank},
-    }
+    REPEATED_FIELDS = frozenset(['lockbox_number', 'deposit_date'])
 
-    def validate(self):
-        self.batch_number = int(self._batch_number_raw)
-        self.item_number = int(self._item_number_raw)
-        self.deposit_date = self._parse_as_date('deposit_date')
-        self.total_num_checks = int(self._total_num_checks_raw)
-        self.check_dollar_total = int(self._check_dollar_total_raw) / 100.0
+    fields = [
+        ('batch_number',          (1, 4),    LockboxFieldType.Numeric),
+        ('item_number',           (4, 7),    LockboxFieldType.Numeric),
+        ('lockbox_number',        (7, 14),   LockboxFieldType.AlphanumericOrBlank),
+        ('deposit_date',          (14, 20),  LockboxFieldType.Numeric),
+        ('total_num_checks',      (20, 24),  LockboxFieldType.Numeric),
+        ('check_dollar_total',    (24, 34),  LockboxFieldType.Numeric),
+        ('last_record_indicator', (34, 35),  LockboxFieldType.AlphanumericOrBlank),
+        ('filler',                (35, 104), LockboxFieldType.Raw),
+    ]
+
+    @derived_field
+    def batch_number(self):
+        return int(self._batch_number_raw)
+
+    @derived_field
+    def item_number(self):
+        return int(self._item_number_raw)
+
+    @derived_field
+    def deposit_date(self):
+        return self._parse_as_date('deposit_date')
+
+    @derived_field
+    def total_num_checks(self):
+        return int(self._total_num_checks_raw)
+
+    @derived_field
+    def check_dollar_total_cents(self):
+        return int(self._check_dollar_total_raw)
+
+    @derived_field
+    def check_dollar_total(self):
+        return self.check_dollar_total_cents / 100.0
 
 class LockboxDestinationTrailerRecord(LockboxBaseRecord):
     RECORD_TYPE_NUM = 9
 
-    fields = {
-        'total_num_records': { 'location': (1, 7), 'type':  LockboxFieldType.Numeric },
-        'filler': {'location': (7, 80), 'type':  LockboxFieldType.Blank },
-    }
+    fields = [
+        ('total_num_records', (1, 7),  LockboxFieldType.Numeric),
+        ('filler',            (7, 80), LockboxFieldType.Blank),
+    ]
 
-    def validate(self):
-        self.total_num_records = int(self._total_num_records_raw)
+    @derived_field
+    def total_num_records(self):
+        return int(self._total_num_records_raw)
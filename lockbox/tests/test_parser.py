@@ -1,8 +1,10 @@
 import datetime
+import io
 import os
 
 from unittest import TestCase
 
+from lockbox.exceptions import LockboxParseError
 from lockbox.parser import LockboxFile
 
 
@@ -22,6 +24,8 @@ class TestLockboxParser(TestCase):
             'test_empty_lockbox.bai',
         )
 
+        self.empty_lockbox_path = empty_lockbox_path
+
         self.valid_lockbox_lines = [l.strip() for l in open(valid_lockbox_path, 'r').readlines()]
         self.empty_lockbox_lines = [l.strip() for l in open(empty_lockbox_path, 'r').readlines()]
 
@@ -42,3 +46,36 @@ class TestLockboxParser(TestCase):
         lockbox_file = LockboxFile.from_lines(self.empty_lockbox_lines)
 
         self.assertEqual(len(lockbox_file.checks), 0)
+
+    def test_parsing_file_opened_in_binary_mode(self):
+        with open(self.empty_lockbox_path, 'rb') as inf:
+            lockbox_file = LockboxFile.from_file(inf)
+
+        self.assertEqual(len(lockbox_file.checks), 0)
+
+    def test_parsing_file_with_invalid_date(self):
+        lines = list(self.empty_lockbox_lines)
+        lines[0] = '100ABCDEFGHIJ00999999911699231800'
+
+        with self.assertRaises(LockboxParseError) as cm:
+            LockboxFile.from_lines(lines)
+
+        self.assertIn('Error parsing Line 1', str(cm.exception))
+        self.assertIn(
+            '169923 is not a valid YYMMDD-formatted date',
+            str(cm.exception),
+        )
+
+    def test_parsing_file_with_form_feed_in_filler(self):
+        contents = '\r\n'.join(
+            [self.empty_lockbox_lines[0] + ' \x0c filler']
+            + self.empty_lockbox_lines[1:]
+        )
+
+        for inf in [
+            io.StringIO(contents),
+            io.BytesIO(contents.encode('ascii')),
+        ]:
+            lockbox_file = LockboxFile.from_file(inf)
+
+            self.assertEqual(len(lockbox_file.checks), 0)
@@ -2,13 +2,19 @@ import datetime
 
 from unittest import TestCase
 
-from lockbox.exceptions import LockboxParseError
+from lockbox.exceptions import (
+    LockboxDefinitionError,
+    LockboxError,
+    LockboxParseError,
+)
 from lockbox.records import (
+    LockboxBaseRecord,
     LockboxBatchTotalRecord,
     LockboxDestinationTrailerRecord,
     LockboxDetailHeader,
     LockboxDetailOverflowRecord,
     LockboxDetailRecord,
+    LockboxFieldType,
     LockboxImmediateAddressHeader,
     LockboxServiceRecord,
     LockboxServiceTotalRecord,
@@ -21,6 +27,92 @@ class TestRecordDefinitions(TestCase):
 
         self.assertIn('record longer than 160', str(cm.exception))
 
+    def test_invalid_field_type(self):
+        with self.assertRaises(LockboxDefinitionError) as cm:
+            class LockboxBogusRecord(LockboxBaseRecord):
+                fields = [
+                    ('bogus', (1, 3), 'bogus'),
+                ]
+
+        self.assertIn('invalid field type found: "bogus"', str(cm.exception))
+
+    def test_field_name_clash(self):
+        with self.assertRaises(LockboxDefinitionError) as cm:
+            class LockboxBogusRecord(LockboxBaseRecord):
+                fields = [
+                    ('validate', (1, 3), LockboxFieldType.Numeric),
+                ]
+
+                def validate(self):
+                    pass
+
+        self.assertIn('already has field "validate"', str(cm.exception))
+
+    def test_duplicate_field_name(self):
+        with self.assertRaises(LockboxDefinitionError) as cm:
+            class LockboxBogusRecord(LockboxBaseRecord):
+                fields = [
+                    ('destination', (1, 11), LockboxFieldType.AlphanumericOrBlank),
+                    ('destination', (11, 21), LockboxFieldType.AlphanumericOrBlank),
+                ]
+
+        self.assertIn('duplicate field "destination"', str(cm.exception))
+
+    def test_unknown_repeated_field(self):
+        with self.assertRaises(LockboxDefinitionError) as cm:
+            class LockboxBogusRecord(LockboxBaseRecord):
+                REPEATED_FIELDS = frozenset(['bogus'])
+
+                fields = [
+                    ('lockbox_number', (1, 8), LockboxFieldType.Numeric),
+                ]
+
+        self.assertIn('unknown repeated field "bogus"', str(cm.exception))
+
+    def test_overlapping_fields(self):
+        class LockboxOverlappingRecord(LockboxBaseRecord):
+            fields = [
+                ('account', (1, 8), LockboxFieldType.Numeric),
+                ('branch', (1, 4), LockboxFieldType.Numeric),
+            ]
+
+        # overlapping fields can't share one line pattern, so each field
+        # is checked on its own
+        self.assertIsNone(LockboxOverlappingRecord._line_pattern)
+
+        rec = LockboxOverlappingRecord('91234567')
+        self.assertEqual(rec.account, '1234567')
+        self.assertEqual(rec.branch, '123')
+
+        with self.assertRaises(LockboxParseError) as cm:
+            LockboxOverlappingRecord('912A4567')
+
+        self.assertIn(
+            'field account does not match expected type numeric',
+            str(cm.exception),
+        )
+
+    def test_subclass_without_fields_keeps_dict(self):
+        class LockboxTaggedDetailRecord(LockboxDetailRecord):
+            pass
+
+        rec = LockboxTaggedDetailRecord(
+            '6001000120000014000123456000123456789000000000'
+        )
+        rec.tag = 'reviewed'
+
+        self.assertEqual(rec.tag, 'reviewed')
+        self.assertEqual(rec.check_amount_cents, 1200000140)
+        self.assertEqual(
+            LockboxTaggedDetailRecord._derived_field_names,
+            LockboxDetailRecord._derived_field_names,
+        )
+
+        with self.assertRaises(AttributeError):
+            LockboxDetailRecord(
+                '6001000120000014000123456000123456789000000000'
+            ).tag = 'reviewed'
+
     def test_invalid_numeric_field(self):
         with self.assertRaises(LockboxParseError) as cm:
             LockboxImmediateAddressHeader('100ABCDEFGHIJ009AA999911605231800')
@@ -52,6 +144,44 @@ class TestRecordDefinitions(TestCase):
         self.assertEqual(rec.processing_date, datetime.date(2016, 5, 23))
         self.assertEqual(rec.processing_time, datetime.time(18, 0))
 
+    def test_numeric_field_padded_with_spaces(self):
+        rec = LockboxImmediateAddressHeader('100ABCDEFGHIJ  99999911605231800')
+
+        self.assertEqual(rec._originating_trn_raw, '  99999911')
+
+    def test_filler_is_not_validated(self):
+        rec = LockboxBatchTotalRecord(
+            '700100000222221605230010000700000  whatever ~ goes here'
+        )
+
+        self.assertEqual(rec.filler, '  whatever ~ goes here')
+
+    def test_derived_fields_are_lazy(self):
+        # the processing date isn't a real date, but that only matters
+        # once something asks for it
+        rec = LockboxImmediateAddressHeader('100ABCDEFGHIJ00999999911699231800')
+
+        self.assertEqual(rec._processing_date_raw, '169923')
+        self.assertEqual(rec.processing_time, datetime.time(18, 0))
+
+        with self.assertRaises(LockboxError):
+            rec.processing_date
+
+        with self.assertRaises(LockboxError):
+            rec.validate()
+
+    def test_validate_fills_derived_fields(self):
+        class LockboxTaggedDetailRecord(LockboxDetailRecord):
+            pass
+
+        rec = LockboxTaggedDetailRecord(
+            '6001000120000014000123456000123456789000000000'
+        )
+        rec.validate()
+
+        self.assertEqual(rec._check_amount_cents_cached, 1200000140)
+        self.assertEqual(rec._check_amount_cached, 12000001.40)
+
     def test_valid_lockbox_service_record(self):
         rec = LockboxServiceRecord(
             '2ABCDEFGHIJ0099999991000000000040008000801'
@@ -122,6 +252,7 @@ class TestRecordDefinitions(TestCase):
         self.assertEqual(rec._deposit_date_raw, '160523')
         self.assertEqual(rec._total_number_remittances_raw, '001')
         self.assertEqual(rec._check_dollar_total_raw, '0000700000')
+        self.assertEqual(rec.check_dollar_total_cents, 700000)
         self.assertEqual(rec.check_dollar_total, 7000.00)
 
     def test_lockbox_service_total_record(self):
@@ -139,6 +270,16 @@ class TestRecordDefinitions(TestCase):
 
         self.assertEqual(rec._total_num_records_raw, '000008')
 
+    def test_non_ascii_digits_are_not_numeric(self):
+        for digits in ['00000²', '0000١٢']:
+            with self.assertRaises(LockboxParseError) as cm:
+                LockboxDestinationTrailerRecord('9' + digits)
+
+            self.assertIn(
+                'field total_num_records does not match expected type numeric',
+                str(cm.exception),
+            )
+
     def test_memo_line_with_valid_nonalpha_char(self):
         rec = LockboxDetailOverflowRecord('40010016019(BLAH:)')
 
@@ -148,3 +289,12 @@ class TestRecordDefinitions(TestCase):
         rec = LockboxDetailOverflowRecord('40010016019')
 
         self.assertEqual(rec._memo_line_raw, '')
+
+    def test_repeated_fields_are_shared(self):
+        line = '700100000222221605230010000700000'
+        first = LockboxBatchTotalRecord(line)
+        second = LockboxBatchTotalRecord(''.join(list(line)))
+
+        self.assertIs(first._lockbox_number_raw, second._lockbox_number_raw)
+        self.assertIs(first.lockbox_number, second.lockbox_number)
+        self.assertIs(first._deposit_date_raw, second._deposit_date_raw)
@@ -12,9 +12,8 @@ setup(
     name='bai-lockbox',
     version='0.0.7',
     packages=find_packages(exclude=['docs', 'tests']),
-    install_requires=[
-        'six',
-    ],
+    install_requires=[],
+    python_requires='>=3.7',
     test_suite='nose.collector',
     tests_require=['nose', 'coverage'],
     include_package_data=True,
@@ -26,11 +25,8 @@ setup(
     author_email='jon@fundersclub.com',
     classifiers=[
         'Development Status :: 3 - Alpha',
-        'Programming Language :: Python :: 2',
-        'Programming Language :: Python :: 2.7',
         'Programming Language :: Python :: 3',
-        'Programming Language :: Python :: 3.5',
-        'Programming Language :: Python :: 3.6',
+        'Programming Language :: Python :: 3.7',
         'License :: OSI Approved :: Apache Software License',
         'Intended Audience :: Developers',
         'Intended Audience :: Financial and Insurance Industry'